@@ -6,26 +6,22 @@ Script to set up Vercel environment variables for Moon-Userbot
 import subprocess
 import sys
 
-def run_vercel_command(cmd):
-    """Run a Vercel command"""
+def run_vercel_command(cmd, input_text=None):
+    """Run a Vercel command, optionally feeding input_text to its stdin"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, input=input_text, capture_output=True, text=True, check=False
+        )
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
 
 def add_env_var(name, value, token):
     """Add an environment variable to Vercel"""
-    cmd = f'vercel env add {name} production main --token {token}'
+    cmd = ["vercel", "env", "add", name, "production", "main", "--token", token]
     
-    # Create a temporary file with the value
-    with open(f'/tmp/{name}.txt', 'w') as f:
-        f.write(value)
-    
-    # Run the command with input from file
-    cmd_with_input = f'vercel env add {name} production main --token {token} < /tmp/{name}.txt'
-    
-    success, stdout, stderr = run_vercel_command(cmd_with_input)
+    # Pipe the value through stdin so it never touches the disk
+    success, stdout, stderr = run_vercel_command(cmd, input_text=value)
     
     if success:
         print(f"✅ Added {name}")